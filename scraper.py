@@ -14,6 +14,7 @@ The module handles various edge cases including URL normalization,
 error handling, and progress tracking.
 
 Key Features:
+    - Fast HTML parsing with precompiled lxml XPath expressions
     - Concurrent scraping with ThreadPoolExecutor
     - Progress visualization with tqdm
     - Flexible scheduling with schedule library
@@ -30,33 +31,318 @@ Example:
 """
 
 import re
+import multiprocessing
 import select
 import sys
-import json
-import time
-from itertools import islice
-from concurrent.futures import ThreadPoolExecutor
-from typing import Optional, Generator, Callable, Dict, Any
+from datetime import timedelta
+from functools import partial
+from types import MappingProxyType
+from concurrent.futures import (ThreadPoolExecutor, ProcessPoolExecutor,
+                                Executor, Future, wait, as_completed,
+                                FIRST_COMPLETED)
+from contextlib import nullcontext
+from typing import (Optional, Generator, Dict, Any, List, Mapping,
+                    Tuple, NamedTuple, Union)
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import requests_cache
+import orjson
 import schedule
-from tqdm import tqdm
-from bs4 import BeautifulSoup
+from tqdm.auto import tqdm
+from lxml import etree, html
+
+
+_RE_AVAIL: re.Pattern = re.compile(r'\((.*?)\)')
+# Catalog pages: the site root, category listings and paginated pages
+_RE_CATALOG_URL: re.Pattern = re.compile(
+    r'://[^/]+/?(index\.html)?$|/category/|/page-\d+\.html$')
+_RATINGS: Mapping[str, int] = MappingProxyType(
+    {'One': 1, 'Two': 2, 'Three': 3, 'Four': 4, 'Five': 5})
+
+# Product page; field expressions are relative to the product_main div
+_XP_MAIN: etree.XPath = etree.XPath('//div[contains(@class, "product_main")]')
+_XP_TITLE: etree.XPath = etree.XPath('string(h1)')
+_XP_PRICE: etree.XPath = etree.XPath(
+    'string(p[contains(@class, "price_color")])')
+_XP_TEXT: etree.XPath = etree.XPath('string()')
+_XP_STARS: etree.XPath = etree.XPath(
+    'string(p[contains(@class, "star-rating")]/@class)')
+_XP_DESC: etree.XPath = etree.XPath(
+    'string(//div[@id="product_description"]/following-sibling::p[1])')
+_XP_INFO: etree.XPath = etree.XPath(
+    '//table[contains(@class, "table")]//tr/td')
+# Product page markup that holds every field read by get_book_data
+_PRODUCT_REGION: Tuple[bytes, bytes] = (b'<article class="product_page"',
+                                        b'</article>')
+
+
+def _extract_price(text: str) -> str:
+    """
+    Cut a price of the form '£X.XX' out of a text.
+
+    Prices on the site are always a pound sign, digits, a dot and two
+    decimals, so two str.index calls replace a regex search.
+
+    Args:
+        text (str): Text containing exactly one price, e.g. '£51.77'.
+
+    Returns:
+        str: The price including the pound sign, e.g. '£51.77'.
+
+    Raises:
+        ValueError: If the text contains no price.
+    """
+    start = text.index('£')
+    return text[start:text.index('.', start) + 3]
+
+
+def _in_catalogue(link: str) -> str:
+    """
+    Return the 'catalogue/' prefix a relative link is missing, if any.
+
+    Args:
+        link (str): Relative href taken from a catalog page.
+
+    Returns:
+        str: '' if the link already points into 'catalogue',
+             'catalogue/' otherwise.
+    """
+    return '' if 'catalogue' in link else 'catalogue/'
+
+
+class CatalogPage(NamedTuple):
+    """
+    Data read from a single catalog page.
+
+    Attributes:
+        links (List[str]): Relative hrefs of the books on the page.
+        next_page (Optional[str]): Relative href of the next page, None
+                                   on the last page.
+        total (Optional[int]): Number of books from the first book of
+                               this page to the end of the catalog,
+                               None if the result counters are missing
+                               (the books are then scraped without a
+                               known total).
+    """
+    links: List[str]
+    next_page: Optional[str]
+    total: Optional[int]
+
+
+class _LinkCollector:
+    """
+    lxml parser target that collects links from a catalog page.
+
+    The parser reports start and end tags to this object instead of
+    building an element tree: book links are the hrefs of <a> tags
+    with a title attribute, the next page is the href of the <a>
+    inside <li class="next">, and the first two <strong> tags of the
+    results form hold the result count and the index of the first book
+    on the page. Tags outside the form are ignored.
+
+    Example:
+        >>> parser = etree.HTMLParser(target=_LinkCollector())
+        >>> page = etree.fromstring(content, parser)
+    """
+
+    def __init__(self) -> None:
+        self.links: List[str] = []
+        self.next_page: Optional[str] = None
+        self.counters: List[str] = []
+        self._in_next: bool = False
+        self._in_form: bool = False
+        self._in_strong: bool = False
+
+    def start(self, tag: str, attrib: Mapping[str, str]) -> None:
+        """Handle an opening tag."""
+        if tag == 'a':
+            href = attrib.get('href')
+            if href and 'title' in attrib:
+                self.links.append(href)
+            elif href and self._in_next:
+                self.next_page = href
+        elif tag == 'li':
+            self._in_next = 'next' in attrib.get('class', '').split()
+        elif tag == 'form':
+            self._in_form = ('form-horizontal'
+                             in attrib.get('class', '').split())
+        elif tag == 'strong' and self._in_form and len(self.counters) < 2:
+            self._in_strong = True
+            self.counters.append('')
+
+    def end(self, tag: str) -> None:
+        """Handle a closing tag."""
+        if tag == 'li':
+            self._in_next = False
+        elif tag == 'form':
+            self._in_form = False
+        elif tag == 'strong':
+            self._in_strong = False
+
+    def data(self, data: str) -> None:
+        """Handle text content."""
+        if self._in_strong:
+            self.counters[-1] += data
+
+    def close(self) -> CatalogPage:
+        """Return everything collected from the page."""
+        total = None
+        counts = [int(c) for c in self.counters if c.strip().isdigit()]
+        if len(counts) == 2:
+            total = counts[0] - counts[1] + 1
+        elif len(counts) == 1:
+            # Single-page listings only render '<strong>N</strong> results.'
+            total = counts[0]
+        return CatalogPage(self.links, self.next_page, total)
+
+
+def make_session(pool_size: int = 100,
+                 cache_name: str = 'books_cache') -> requests.Session:
+    """
+    Create a cached requests session with a connection pool sized for
+    concurrent workers.
+
+    urllib3 keeps only 10 connections per host by default, so with more
+    workers than that most keep-alive sockets are discarded and
+    reopened. Transient gateway errors are retried with backoff.
+
+    Responses are cached in SQLite for 23 hours (catalog pages for one
+    hour), honouring Cache-Control and revalidating stale entries with
+    ETag/Last-Modified, so scheduled re-runs mostly get 304s for book
+    pages that did not change.
+
+    Args:
+        pool_size (int): Maximum number of pooled connections per host
+                         (default: 100).
+        cache_name (str): Path of the SQLite cache, without the
+                          '.sqlite' extension (default: 'books_cache').
+
+    Returns:
+        requests.Session: requests_cache.CachedSession with an
+                          HTTPAdapter mounted for both 'http://' and
+                          'https://'.
+
+    Example:
+        >>> with make_session(pool_size=70) as session:
+        ...     soup = get_soup(session, "https://books.toscrape.com/")
+    """
+    session = requests_cache.CachedSession(
+        cache_name,
+        backend='sqlite',
+        expire_after=timedelta(hours=23),
+        urls_expire_after={_RE_CATALOG_URL: timedelta(hours=1)},
+        cache_control=True)
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=Retry(total=3, backoff_factor=0.3,
+                          status_forcelist=[502, 503, 504]))
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def fetch_page(session: requests.Session, base_url: str) -> bytes:
+    """
+    Fetch the raw body of a page.
+
+    This is the only place where network I/O happens, so parsing can
+    stay synchronous and independent of the transport. The connection
+    is returned to the pool as soon as the body is read.
+
+    Args:
+        session (requests.Session): The requests session to use for the
+                                    HTTP request.
+        base_url (str): The URL to fetch.
+
+    Returns:
+        bytes: Undecoded response body.
+
+    Raises:
+        requests.RequestException: If there's an issue with the HTTP
+                                   request (connection error, timeout,
+                                   HTTP error, etc.)
+    """
+    with session.get(base_url, timeout=20) as response:
+        response.raise_for_status()
+        return response.content
+
+
+def _slice_region(content: bytes, start: bytes, end: bytes) -> bytes:
+    """
+    Cut the markup from the start marker to the end marker out of a
+    page.
+
+    Args:
+        content (bytes): Full page body.
+        start (bytes): Opening marker, included in the fragment.
+        end (bytes): Closing marker, included in the fragment.
+
+    Returns:
+        bytes: The fragment, or the unchanged page if either marker is
+               missing.
+    """
+    i = content.find(start)
+    j = content.find(end, i)
+    if i == -1 or j == -1:
+        return content
+    return content[i:j + len(end)]
+
+
+def parse_html(content: bytes,
+               region: Optional[Tuple[bytes, bytes]] = None
+               ) -> Optional[html.HtmlElement]:
+    """
+    Parse a page body into an lxml element tree.
+
+    The bytes are parsed with an explicit UTF-8 parser, the charset
+    Books.toscrape.com serves, so lxml neither has to sniff the encoding
+    nor restart on <meta charset>, and page fragments without a <head>
+    parse correctly.
+
+    Args:
+        content (bytes): Raw page body.
+        region (Optional[Tuple[bytes, bytes]]): Start and end markers of
+                                                the only part of the
+                                                page to parse. The whole
+                                                page is parsed if None
+                                                or a marker is missing.
+
+    Returns:
+        Optional[html.HtmlElement]: Root element of the document, or
+                                    None if it cannot be parsed.
+    """
+    if region:
+        content = _slice_region(content, *region)
+    try:
+        return html.fromstring(content,
+                               parser=html.HTMLParser(encoding='utf-8'))
+    except etree.ParserError:
+        return None
 
 
 def get_soup(session: requests.Session,
-             base_url: str) -> Optional[BeautifulSoup]:
+             base_url: str,
+             region: Optional[Tuple[bytes, bytes]] = None
+             ) -> Optional[html.HtmlElement]:
     """
-    Fetch HTML content from a URL and parse it into a BeautifulSoup
-    object.
+    Fetch HTML content from a URL and parse it into an lxml element
+    tree.
 
     Args:
         session (requests.Session): The requests session to use for the
                                     HTTP request.
         base_url (str): The URL to fetch HTML content from.
+        region (Optional[Tuple[bytes, bytes]]): Start and end markers of
+                                                the only part of the
+                                                page to parse. The whole
+                                                page is parsed if None
+                                                or a marker is missing.
 
     Returns:
-        Optional[BeautifulSoup]:
-            - BeautifulSoup object if request is successful
+        Optional[html.HtmlElement]:
+            - Root element of the document if request is successful
             - None if an error occurs during HTML parsing
 
     Raises:
@@ -74,22 +360,70 @@ def get_soup(session: requests.Session,
         >>> session = requests.Session()
         >>> try:
         ...     soup = get_soup(session, "https://example.com")
-        ...     if soup:
-        ...         title = soup.find('title')
-        ...         print(title.text)
+        ...     if soup is not None:
+        ...         print(soup.findtext('.//title'))
         ... except requests.RequestException as e:
         ...     print(f"Request failed: {e}")
         >>> session.close()
     """
-    response = session.get(base_url, timeout=20)
-    response.raise_for_status()
-    return BeautifulSoup(response.content, 'lxml')
+    return parse_html(fetch_page(session, base_url), region)
+
+
+def parse_catalog_page(content: bytes) -> CatalogPage:
+    """
+    Read book links, next page link and result counters from the body
+    of a catalog page.
+
+    The page is scanned by an lxml parser target in a single pass,
+    without building an element tree.
+
+    Args:
+        content (bytes): Raw body of the catalog page.
+
+    Returns:
+        CatalogPage: Relative links and the number of books left in the
+                     catalog starting from this page.
+    """
+    return etree.fromstring(
+        content, etree.HTMLParser(target=_LinkCollector(), encoding='utf-8'))
+
+
+def get_catalog_page(session: requests.Session,
+                     base_url: str) -> CatalogPage:
+    """
+    Fetch a catalog page and read its book links, next page link and
+    result counters.
+
+    Args:
+        session (requests.Session): The requests session to use for the
+                                    HTTP request.
+        base_url (str): URL of the catalog page.
+
+    Returns:
+        CatalogPage: Relative links and the number of books left in the
+                     catalog starting from this page.
+
+    Raises:
+        requests.RequestException: If there's an issue with the HTTP
+                                   request (connection error, timeout,
+                                   HTTP error, etc.)
+
+    Example:
+        >>> with requests.Session() as session:
+        ...     page = get_catalog_page(session,
+        ...                             "https://books.toscrape.com/")
+        >>> print(page.total, len(page.links))
+        1000 20
+    """
+    return parse_catalog_page(fetch_page(session, base_url))
 
 
 def get_books_links(
         session: requests.Session,
         base_url: str,
-        _raw_url: Optional[str] = None) -> Generator[str, None, None]:
+        _raw_url: Optional[str] = None,
+        first_page: Optional[CatalogPage] = None
+) -> Generator[str, None, None]:
     """
     Generates book links from an online catalog.
 
@@ -103,6 +437,9 @@ def get_books_links(
         base_url (str): Base catalog URL to start parsing from
         _raw_url (Optional[str]): Raw URL for edge case testing.
                                   If not provided, uses base_url + '/'
+        first_page (Optional[CatalogPage]): Already fetched page at
+                                            base_url, used instead of
+                                            requesting it again.
 
     Yields:
         str: Full URLs of book links
@@ -129,32 +466,73 @@ def get_books_links(
                                                _raw_url=r_url))
             ...     print(f"Found {len(res)} books start with page 31")
     """
-    in_catalogue: Callable[[str], str] = lambda link: (
-        '' if 'catalogue' in link else 'catalogue/'
-    )
-
     if not _raw_url:
         _raw_url = base_url.rstrip('/') + '/'
 
+    page = first_page
     while base_url:
-        soup = get_soup(session, base_url)
-        if not soup:
-            break
-
-        for link in soup.find_all('a', title=True):
-            href = link.get('href', '')
-            if href:
-                yield _raw_url + in_catalogue(href) + href
-
-        next_page = soup.find('li', class_='next')
-        if next_page and next_page.a:
-            next_page = next_page.a['href']
-            base_url = _raw_url + in_catalogue(next_page) + next_page
+        if page is None:
+            page = get_catalog_page(session, base_url)
+
+        for href in page.links:
+            yield _raw_url + _in_catalogue(href) + href
+
+        if page.next_page:
+            base_url = (_raw_url + _in_catalogue(page.next_page)
+                        + page.next_page)
         else:
             base_url = None
+        page = None
+
+
+def parse_book_data(content: bytes) -> Dict[str, Any]:
+    """
+    Extracts book data from the body of a product page.
+
+    Takes and returns only picklable values and does no I/O, so it can
+    run in a worker process.
+
+    Args:
+        content (bytes): Raw body of the book's product page.
+
+    Returns:
+        Dict[str, Any]: Book data as described in get_book_data, or an
+                        empty dictionary if the page cannot be parsed.
+    """
+    book_data: Dict[str, Any] = {}
+    soup: Optional[html.HtmlElement] = parse_html(content, _PRODUCT_REGION)
+
+    main: List[html.HtmlElement] = []
+    info: List[str] = []
+    if soup is not None:
+        main = _XP_MAIN(soup)
+        info = [td.text_content() for td in _XP_INFO(soup)]
+
+    if main and info:
+        p_main = main[0]
+        book_data = {
+            'title': _XP_TITLE(p_main).strip(),
+            'price': _extract_price(_XP_PRICE(p_main)),
+            'in stock': _RE_AVAIL.search(_XP_TEXT(p_main)).group(1),
+            'rating': _RATINGS.get(_XP_STARS(p_main).split()[-1], None),
+            'product description': _XP_DESC(soup).strip(),
+            'product information': {
+                'UPC': info[0],
+                'product Type': info[1],
+                'price (excl. tax)': _extract_price(info[2]),
+                'price (incl. tax)': _extract_price(info[3]),
+                'tax': _extract_price(info[4]),
+                'availability': _RE_AVAIL.search(info[5]).group(1),
+                'number of reviews': info[6]
+            }
+        }
 
+    return book_data
 
-def get_book_data(session: requests.Session, book_url: str) -> Dict[str, Any]:
+
+def get_book_data(session: requests.Session,
+                  book_url: str,
+                  parser: Optional[Executor] = None) -> Dict[str, Any]:
     """
     Extracts detailed information about a book from its product page.
 
@@ -167,6 +545,10 @@ def get_book_data(session: requests.Session, book_url: str) -> Dict[str, Any]:
         session (requests.Session): The requests session to use for HTTP
                                     requests
         book_url (str): The URL of the book's product page to scrape.
+        parser (Optional[Executor]): Executor to run parse_book_data
+                                     in, e.g. a ProcessPoolExecutor.
+                                     The page is parsed in the calling
+                                     thread if None.
 
     Returns:
         Dict[str, Any]: A dictionary containing book data with the
@@ -211,86 +593,102 @@ def get_book_data(session: requests.Session, book_url: str) -> Dict[str, Any]:
         >>> print(book_data['rating'])
         3
     """
-    book_data: Dict[str, Any] = {}
-    ratings: Dict[str, int] = {'One': 1, 'Two': 2, 'Three': 3, 'Four': 4,
-                               'Five': 5}
-    re_price: re.Pattern = re.compile(r'£\d+\.\d{2}')
-    re_availability: re.Pattern = re.compile(r'\((.*?)\)')
-    soup: Optional[BeautifulSoup] = get_soup(session, book_url)
-
-    p_main: BeautifulSoup
-    info_table: BeautifulSoup
-    desc: BeautifulSoup
-    if soup:
-        p_main = soup.find('div', class_='col-sm-6 product_main')
-        info_table = soup.find('table')
-        desc = soup.find('div', id='product_description')
-
-    if soup and p_main and info_table:
-        book_data = {
-            'title': p_main.find('h1').text.strip(),
-            'price': (re_price
-                      .search(p_main
-                              .find('p', class_='price_color')
-                              .text)
-                      .group()),
-            'in stock': re_availability.search(p_main.text).group(1),
-            'rating': (
-                ratings.get(
-                    p_main.find('p', class_='star-rating')['class'][-1],
-                    None)
-            ),
-            'product description': (desc
-                                    .find_next_sibling('p')
-                                    .text
-                                    .strip()) if desc else '',
-            'product information': {
-                'UPC': info_table.find_all('tr')[0].td.text,
-                'product Type': info_table.find_all('tr')[1].td.text,
-                'price (excl. tax)': (
-                    re_price.search(info_table.find_all('tr')[2].td.text)
-                    .group()),
-                'price (incl. tax)': (
-                    re_price.search(info_table.find_all('tr')[3].td.text)
-                    .group()),
-                'tax': (re_price
-                        .search(info_table.find_all('tr')[4].td.text)
-                        .group()),
-                'availability': (re_availability
-                                 .search(info_table.find_all('tr')[5].td.text)
-                                 .group(1)),
-                'number of reviews': info_table.find_all('tr')[6].td.text
-            }
-        }
+    content = fetch_page(session, book_url)
+    if parser is None:
+        return parse_book_data(content)
+    return parser.submit(parse_book_data, content).result()
 
-    return book_data
+
+def _collect_books(pending: Dict[Future, str],
+                   books: Dict[str, Any],
+                   pbar: tqdm,
+                   drain: bool = False) -> None:
+    """
+    Wait for pending book futures and move their results into books.
+
+    Args:
+        pending (Dict[Future, str]): Futures of get_book_data mapped to
+                                     their book URLs. Finished futures
+                                     are removed from it.
+        books (Dict[str, Any]): Results accumulator keyed by book URL.
+        pbar (tqdm): Progress bar advanced by the number of finished
+                     books.
+        drain (bool): If False, return as soon as at least one future
+                      has finished. If True, consume every pending
+                      future in completion order (default: False).
+
+    Raises:
+        requests.RequestException: Propagated from a failed book
+                                   request.
+    """
+    done = (as_completed(list(pending)) if drain
+            else wait(pending, return_when=FIRST_COMPLETED).done)
+    for future in done:
+        books[pending.pop(future)] = future.result()
+        pbar.update(1)
+
+
+def _parser_pool(parse_workers: Optional[int]
+                 ) -> Union[ProcessPoolExecutor, nullcontext]:
+    """
+    Create the process pool used to parse book pages.
+
+    Worker processes are spawned rather than forked: by the time the
+    pool starts, the fetching threads and the cache's SQLite connection
+    already exist and must not be copied into the children.
+
+    Args:
+        parse_workers (Optional[int]): Number of processes, None for one
+                                       per CPU.
+
+    Returns:
+        Union[ProcessPoolExecutor, nullcontext]: The pool, or a context
+                                                 yielding None if
+                                                 parse_workers is 0.
+    """
+    if parse_workers == 0:
+        return nullcontext()
+    return ProcessPoolExecutor(
+        max_workers=parse_workers,
+        mp_context=multiprocessing.get_context('spawn'))
 
 
-def scrape_books(
+def scrape_books(  # pylint: disable=too-many-arguments,too-many-locals
         base_url: str = '',
         _raw_url: Optional[str] = None,
         batch_size: int = 200,
         is_save: bool = False,
-        file_name: str = './artifacts/books_data.txt') -> Dict[str, Any]:
+        file_name: str = './artifacts/books_data.txt',
+        *,
+        max_workers: int = 70,
+        parse_workers: Optional[int] = 0) -> Dict[str, Any]:
     """
     Scrapes book data from an online catalog using parallel processing.
 
     This function iterates through all pages of a book catalog, extracts
-    book URLs, and then concurrently scrapes detailed information for
-    each book. It features progress tracking, batch processing,
-    and optional data persistence.
+    book URLs, and concurrently scrapes detailed information for each
+    book while the following catalog pages are still being discovered.
+    It features progress tracking, bounded queueing and optional data
+    persistence.
 
     Args:
         base_url (str): The starting URL of the book catalog to scrape.
         _raw_url (Optional[str]): Internal parameter for edge case
                                   handling of URL formatting.
-        batch_size (int): Number of books to process in each batch
-                          (default: 200).
+        batch_size (int): Maximum number of discovered books queued or
+                          in flight at once (default: 200).
         is_save (bool): If True, saves the scraped data to a file
                         (default: False).
         file_name (str): Path where to save the resulting file when
                          is_save is True
                          (default: './artifacts/books_data.txt').
+        max_workers (int): Keyword-only. Maximum number of book pages
+                           fetched concurrently (default: 70).
+        parse_workers (Optional[int]): Keyword-only. Number of processes
+                                       parsing the fetched pages; 0
+                                       parses in the fetching threads,
+                                       None uses one process per CPU
+                                       (default: 0).
 
     Returns:
         Dict[str, Any]: A dictionary where keys are book URLs
@@ -299,7 +697,17 @@ def scrape_books(
                         Returns empty dict if no books found.
 
     Note:
-        Uses ThreadPoolExecutor for concurrent scraping.
+        Uses ThreadPoolExecutor for concurrent scraping: the calling
+        thread walks the catalog and submits each book as soon as it is
+        found, so pagination overlaps with book fetching. Book pages
+        are parsed in the fetching threads unless parse_workers is
+        non-zero, in which case they go to a ProcessPoolExecutor. Its
+        worker processes are spawned, so only when parse_workers is
+        enabled must scripts call this function under an
+        `if __name__ == '__main__':` guard.
+        One pooled session and one thread pool (plus the optional
+        process pool) are created per call and shared by the whole
+        scrape.
         Includes progress visualization with tqdm.
         Saves data only if is_save=True and books data is available.
 
@@ -327,27 +735,25 @@ def scrape_books(
     books: Dict[str, Any] = {}
 
     try:
-        with requests.Session() as session:
-            links = get_books_links(session, base_url, _raw_url)
-            soup = get_soup(session, base_url)
-
-            if soup:
-                strong_tags = soup.find_all('strong')
-                total = int(strong_tags[0].text) - int(strong_tags[1].text) + 1
-
-                with tqdm(total=total, desc='Scrape books', ncols=100) as pbar:
-                    with ThreadPoolExecutor(max_workers=70) as executor:
-                        while True:
-                            batch = list(islice(links, batch_size))
-                            if not batch:
-                                break
-
-                            books.update(
-                                zip(batch, executor.map(
-                                    lambda url: get_book_data(session, url),
-                                    batch))
-                            )
-                            pbar.update(len(batch))
+        with make_session(max(100, max_workers)) as session:
+            first_page = get_catalog_page(session, base_url)
+            links = get_books_links(session, base_url, _raw_url, first_page)
+
+            with tqdm(total=first_page.total, desc='Scrape books',
+                      ncols=100, mininterval=0.5, miniters=25,
+                      smoothing=0.1) as pbar:
+                with _parser_pool(parse_workers) as parser, \
+                        ThreadPoolExecutor(
+                            max_workers=max_workers) as executor:
+                    fetch_book = partial(get_book_data, session,
+                                         parser=parser)
+                    pending: Dict[Future, str] = {}
+                    for url in links:
+                        if len(pending) >= batch_size:
+                            _collect_books(pending, books, pbar)
+                        pending[executor.submit(fetch_book, url)] = url
+
+                    _collect_books(pending, books, pbar, drain=True)
 
     except requests.RequestException as e:
         print(f"Error during scraping {base_url}: {e}")
@@ -355,8 +761,10 @@ def scrape_books(
     finally:
         if is_save:
             if books:
-                with open(file_name, 'w', encoding='utf-8') as f:
-                    json.dump(books, f, ensure_ascii=False, indent=4)
+                with open(file_name, 'wb') as f:
+                    # orjson is a C extension pylint cannot introspect
+                    # pylint: disable-next=no-member
+                    f.write(orjson.dumps(books, option=orjson.OPT_INDENT_2))
                 print(f"The data has been saved to file '{file_name}'!")
             else:
                 print("No data to save - books dictionary is empty")
@@ -372,13 +780,19 @@ if __name__ == '__main__':
         print('Task Scheduler has started.')
         print('To stop, type S/s and press Enter.')
 
+        stdin = [sys.stdin]
         while True:
             schedule.run_pending()
-            if select.select([sys.stdin], [], [], 0.1)[0]:
-                if sys.stdin.readline().strip().lower() in ['S', 's']:
+            # Sleep until the next job is due or a line arrives on stdin
+            idle = schedule.idle_seconds()
+            timeout = None if idle is None else max(idle, 0)
+            if select.select(stdin, [], [], timeout)[0]:
+                line = sys.stdin.readline()
+                if not line:
+                    stdin = []  # stdin closed, only wait for jobs
+                elif line.strip().lower() in ['S', 's']:
                     print("Stopping scheduler...")
                     break
-            time.sleep(1)
 
     except KeyboardInterrupt:
         print('\nThe scraping process has terminated!')
@@ -6,3 +6,175 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from scraper import *
+from scraper import (_extract_price, _slice_region, _PRODUCT_REGION,
+                     CatalogPage)
+
+
+CATALOG_PAGE = '''<!DOCTYPE html>
+<html><head><meta charset="utf-8"></head><body>
+<div class="alert"><strong>Warning!</strong> Demo website.</div>
+<form method="get" class="form-horizontal">
+    <strong>1000</strong> results - showing <strong>21</strong>
+    to <strong>40</strong>.
+</form>
+<ol class="row">
+<li><article class="product_pod">
+    <div class="image_container">
+        <a href="a-light-in-the-attic_1000/index.html"><img src="x.jpg"></a>
+    </div>
+    <h3><a href="a-light-in-the-attic_1000/index.html"
+           title="A Light in the Attic">A Light in the ...</a></h3>
+</article></li>
+<li><article class="product_pod">
+    <h3><a href="tipping-the-velvet_999/index.html"
+           title="Tipping the Velvet">Tipping the Velvet</a></h3>
+</article></li>
+</ol>
+<ul class="pager">
+    <li class="previous"><a href="page-1.html">previous</a></li>
+    <li class="current">Page 2 of 50</li>
+    <li class="next"><a href="page-3.html">next</a></li>
+</ul>
+</body></html>
+'''.encode('utf-8')
+
+SINGLE_PAGE_CATALOG = '''<html><body>
+<form method="get" class="form-horizontal">
+    <strong>2</strong> results.
+</form>
+<h3><a href="catalogue/soumission_998/index.html"
+       title="Soumission">Soumission</a></h3>
+<h3><a href="catalogue/sharp-objects_997/index.html"
+       title="Sharp Objects">Sharp Objects</a></h3>
+</body></html>
+'''.encode('utf-8')
+
+BOOK_PAGE = '''<!DOCTYPE html>
+<html><head>
+<title>A Light in the Attic | Books to Scrape</title>
+<meta http-equiv="content-type" content="text/html; charset=UTF-8" />
+</head><body>
+<ul class="breadcrumb"><li><a href="../../index.html">Home</a></li></ul>
+<article class="product_page">
+<div class="row">
+<div class="col-sm-6 product_main">
+    <h1>A Light in the Attic</h1>
+    <p class="price_color">£51.77</p>
+    <p class="instock availability">
+        <i class="icon-ok"></i> In stock (22 available)
+    </p>
+    <p class="star-rating Three"><i class="icon-star"></i></p>
+</div>
+</div>
+<div id="product_description" class="sub-header">
+    <h2>Product Description</h2>
+</div>
+<p>It’s hard to imagine a world without A Light in the Attic.</p>
+<div class="sub-header"><h2>Product Information</h2></div>
+<table class="table table-striped">
+<tr><th>UPC</th><td>a897fe39b1053632</td></tr>
+<tr><th>Product Type</th><td>Books</td></tr>
+<tr><th>Price (excl. tax)</th><td>£51.77</td></tr>
+<tr><th>Price (incl. tax)</th><td>£51.77</td></tr>
+<tr><th>Tax</th><td>£0.00</td></tr>
+<tr><th>Availability</th><td>In stock (22 available)</td></tr>
+<tr><th>Number of reviews</th><td>0</td></tr>
+</table>
+</article>
+<footer class="footer">Footer</footer>
+</body></html>
+'''.encode('utf-8')
+
+EXPECTED_BOOK = {
+    'title': 'A Light in the Attic',
+    'price': '£51.77',
+    'in stock': '22 available',
+    'rating': 3,
+    'product description': ('It’s hard to imagine a world without '
+                            'A Light in the Attic.'),
+    'product information': {
+        'UPC': 'a897fe39b1053632',
+        'product Type': 'Books',
+        'price (excl. tax)': '£51.77',
+        'price (incl. tax)': '£51.77',
+        'tax': '£0.00',
+        'availability': '22 available',
+        'number of reviews': '0'
+    }
+}
+
+
+def test_parse_catalog_page_links_next_page_and_counters():
+    page = parse_catalog_page(CATALOG_PAGE)
+
+    assert page == CatalogPage(
+        links=['a-light-in-the-attic_1000/index.html',
+               'tipping-the-velvet_999/index.html'],
+        next_page='page-3.html',
+        total=1000 - 21 + 1)
+
+
+def test_parse_catalog_page_single_counter():
+    page = parse_catalog_page(SINGLE_PAGE_CATALOG)
+
+    assert page.links == ['catalogue/soumission_998/index.html',
+                          'catalogue/sharp-objects_997/index.html']
+    assert page.next_page is None
+    assert page.total == 2
+
+
+def test_parse_catalog_page_without_counters():
+    page = parse_catalog_page(b'<html><body><p>Nothing</p></body></html>')
+
+    assert page == CatalogPage(links=[], next_page=None, total=None)
+
+
+def test_parse_book_data():
+    assert parse_book_data(BOOK_PAGE) == EXPECTED_BOOK
+
+
+def test_parse_book_data_without_description():
+    content = BOOK_PAGE.replace(
+        b'<p>It\xe2\x80\x99s hard to imagine a world without '
+        b'A Light in the Attic.</p>', b'')
+    content = content.replace(b'id="product_description" ', b'')
+
+    book = parse_book_data(content)
+
+    assert book['product description'] == ''
+    assert book['title'] == EXPECTED_BOOK['title']
+
+
+def test_parse_book_data_without_product_article():
+    content = BOOK_PAGE.replace(b'<article class="product_page">',
+                                b'<article>')
+
+    assert _slice_region(content, *_PRODUCT_REGION) == content
+    assert parse_book_data(content) == EXPECTED_BOOK
+
+
+def test_parse_book_data_not_a_product_page():
+    assert parse_book_data(CATALOG_PAGE) == {}
+    assert parse_book_data(b'') == {}
+
+
+def test_slice_region():
+    fragment = _slice_region(BOOK_PAGE, *_PRODUCT_REGION)
+
+    assert fragment.startswith(b'<article class="product_page">')
+    assert fragment.endswith(b'</article>')
+    assert b'<footer' not in fragment
+
+
+@pytest.mark.parametrize('text, price', [
+    ('£51.77', '£51.77'),
+    ('\n    £0.00  ', '£0.00'),
+    ('Price: £100.05 each', '£100.05'),
+])
+def test_extract_price(text, price):
+    assert _extract_price(text) == price
+
+
+def test_extract_price_missing():
+    with pytest.raises(ValueError):
+        _extract_price('Free')